@@ -6,6 +6,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 import warnings
+from src.aggregate_presentations import aggregate_presentations, simd_ratio
 warnings.filterwarnings('ignore')
 
 # Page configuration
@@ -53,17 +54,17 @@ st.markdown("""
 # Load data with caching
 @st.cache_data
 def load_data():
-    df_full = pd.read_csv('data/mental_health_presentations_full.csv')
+    # Row-level data may not fit in memory, so it is aggregated chunk by chunk
+    aggregates = aggregate_presentations('data/mental_health_presentations_full.csv')
     df_daily = pd.read_csv('data/mental_health_daily_summary.csv')
     df_monthly = pd.read_csv('data/mental_health_monthly_summary.csv')
     
-    df_full['date'] = pd.to_datetime(df_full['date'])
     df_daily['date'] = pd.to_datetime(df_daily['date'])
     
-    return df_full, df_daily, df_monthly
+    return aggregates, df_daily, df_monthly
 
 # Load data
-df_full, df_daily, df_monthly = load_data()
+aggregates, df_daily, df_monthly = load_data()
 
 # Sidebar
 with st.sidebar:
@@ -103,15 +104,15 @@ if page == "🏠 Overview":
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_presentations = df_full['presentations'].sum()
+        total_presentations = aggregates['year']['presentations'].sum()
         st.metric("Total Presentations", f"{total_presentations:,}")
     
     with col2:
-        health_boards = df_full['health_board'].nunique()
+        health_boards = len(aggregates['health_board'])
         st.metric("Health Boards", health_boards)
     
     with col3:
-        date_range = f"{df_full['date'].min().year}-{df_full['date'].max().year}"
+        date_range = f"{aggregates['year']['year'].min()}-{aggregates['year']['year'].max()}"
         st.metric("Time Period", date_range)
     
     with col4:
@@ -177,7 +178,7 @@ elif page == "📊 Exploratory Analysis":
     # Yearly trends
     st.markdown('<p class="sub-header">Annual Trends</p>', unsafe_allow_html=True)
     
-    yearly_totals = df_full.groupby('year')['presentations'].sum().reset_index()
+    yearly_totals = aggregates['year'].copy()
     
     fig = px.bar(
         yearly_totals,
@@ -195,7 +196,7 @@ elif page == "📊 Exploratory Analysis":
     # Monthly seasonality
     st.markdown('<p class="sub-header">Seasonal Patterns</p>', unsafe_allow_html=True)
     
-    monthly_pattern = df_full.groupby('month')['presentations'].sum().reset_index()
+    monthly_pattern = aggregates['month'].copy()
     month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
     monthly_pattern['month_name'] = monthly_pattern['month'].apply(lambda x: month_names[x-1])
     
@@ -213,7 +214,7 @@ elif page == "📊 Exploratory Analysis":
     # Day of week
     st.markdown('<p class="sub-header">Weekly Patterns</p>', unsafe_allow_html=True)
     
-    dow_pattern = df_full.groupby('day_of_week')['presentations'].sum().reset_index()
+    dow_pattern = aggregates['day_of_week'].copy()
     dow_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
     dow_pattern['day_name'] = dow_pattern['day_of_week'].apply(lambda x: dow_names[x])
     
@@ -232,7 +233,7 @@ elif page == "🗺️ Geographic Analysis":
     st.markdown('<p class="main-header">🗺️ Geographic Analysis</p>', unsafe_allow_html=True)
     
     # Health board comparison
-    board_totals = df_full.groupby('health_board')['presentations'].sum().reset_index()
+    board_totals = aggregates['health_board'].copy()
     board_totals = board_totals.sort_values('presentations', ascending=True)
     
     fig = px.bar(
@@ -252,7 +253,7 @@ elif page == "🗺️ Geographic Analysis":
     
     selected_boards = st.multiselect(
         "Select health boards to compare:",
-        options=df_full['health_board'].unique(),
+        options=aggregates['health_board']['health_board'],
         default=[board_totals.iloc[-1]['health_board'], board_totals.iloc[-2]['health_board']]
     )
     
@@ -279,7 +280,7 @@ elif page == "👥 Demographics":
     
     with col1:
         # Age distribution
-        age_dist = df_full.groupby('age_group')['presentations'].sum().reset_index()
+        age_dist = aggregates['age_group'].copy()
         
         fig = px.pie(
             age_dist,
@@ -294,7 +295,7 @@ elif page == "👥 Demographics":
     
     with col2:
         # Presentation types
-        type_dist = df_full.groupby('presentation_type')['presentations'].sum().reset_index()
+        type_dist = aggregates['presentation_type'].copy()
         type_dist = type_dist.sort_values('presentations', ascending=True)
         
         fig = px.bar(
@@ -312,7 +313,7 @@ elif page == "👥 Demographics":
     # SIMD Analysis
     st.markdown('<p class="sub-header">Socioeconomic Impact (SIMD Quintiles)</p>', unsafe_allow_html=True)
     
-    simd_dist = df_full.groupby('simd_quintile')['presentations'].sum().reset_index()
+    simd_dist = aggregates['simd_quintile'].copy()
     simd_dist['simd_label'] = simd_dist['simd_quintile'].apply(
         lambda x: f"Q{x} ({'Most Deprived' if x==1 else 'Least Deprived' if x==5 else ''})"
     )
@@ -330,8 +331,7 @@ elif page == "👥 Demographics":
     fig.update_layout(height=500, showlegend=False, template='plotly_white')
     st.plotly_chart(fig, use_container_width=True)
     
-    ratio = simd_dist[simd_dist['simd_quintile']==1]['presentations'].values[0] / \
-            simd_dist[simd_dist['simd_quintile']==5]['presentations'].values[0]
+    ratio = simd_ratio(aggregates)
     
     st.markdown(f"""
     <div class='insight-box'>
@@ -0,0 +1,132 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import pandas as pd
+
+# Row-level file written by generate_mental_health_data.save_data
+FULL_DATA_PATH = 'data/mental_health_presentations_full.csv'
+
+# Dimensions the dashboard reports presentation totals by
+AGGREGATION_COLUMNS = [
+    'year',
+    'month',
+    'day_of_week',
+    'health_board',
+    'age_group',
+    'simd_quintile',
+    'presentation_type'
+]
+
+# Categorical columns are read as category to keep each chunk small
+COLUMN_DTYPES = {
+    'year': 'int16',
+    'month': 'int8',
+    'day_of_week': 'int8',
+    'health_board': 'category',
+    'age_group': 'category',
+    'simd_quintile': 'int8',
+    'presentation_type': 'category',
+    'presentations': 'int64'
+}
+
+# Each worker holds one byte range of the CSV (plus its parsed frame) at a time
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 4
+
+def _byte_ranges(path, chunk_bytes):
+    # Split the data rows into (start, end) offsets that fall on line boundaries.
+    # Only seeks and single-line reads happen here, so this is cheap on large files.
+    file_size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        header = f.readline()
+        start = f.tell()
+        while start < file_size:
+            f.seek(min(start + chunk_bytes, file_size))
+            if f.tell() < file_size:
+                f.readline()
+            end = f.tell()
+            yield header, start, end
+            start = end
+
+def _aggregate_range(path, header, start, end):
+    # Workers read and parse their own range, so only offsets go to the pool
+    # and only the partial sums come back.
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    chunk = pd.read_csv(
+        io.BytesIO(header + data),
+        usecols=list(COLUMN_DTYPES),
+        dtype=COLUMN_DTYPES
+    )
+    return _aggregate_chunk(chunk)
+
+def _aggregate_chunk(chunk):
+    # Partial aggregation: each chunk is reduced to one small Series per dimension.
+    # Category levels differ between chunks, so keys are merged as plain values.
+    partial = {}
+    for column in AGGREGATION_COLUMNS:
+        series = chunk.groupby(column, observed=True)['presentations'].sum()
+        series.index = series.index.astype(object)
+        partial[column] = series
+    return partial
+
+def _merge_partials(totals, partial):
+    for column, series in partial.items():
+        if column in totals:
+            totals[column] = totals[column].add(series, fill_value=0)
+        else:
+            totals[column] = series
+    return totals
+
+def aggregate_presentations(path=FULL_DATA_PATH, chunk_bytes=DEFAULT_CHUNK_BYTES,
+                            max_workers=DEFAULT_MAX_WORKERS):
+    """Aggregate the row-level CSV out of core and return presentation totals by dimension.
+
+    The file is split into byte ranges of about ``chunk_bytes`` on line
+    boundaries. Each worker process reads, parses and sums its own range and
+    returns only the per-dimension totals, which the parent merges. Peak
+    memory is roughly ``max_workers`` ranges of ``chunk_bytes`` plus their
+    parsed frames, independent of file size; the parent holds only offsets
+    and the merged totals. Rows must not contain quoted newlines.
+    """
+    max_pending = 2 * max_workers
+    totals = {}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for header, start, end in _byte_ranges(path, chunk_bytes):
+            pending.add(executor.submit(_aggregate_range, path, header, start, end))
+
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _merge_partials(totals, future.result())
+
+        for future in pending:
+            _merge_partials(totals, future.result())
+
+    aggregates = {}
+    for column in AGGREGATION_COLUMNS:
+        series = totals.get(column, pd.Series(dtype='int64'))
+        series = series.astype('int64').sort_index()
+        aggregates[column] = series.rename_axis(column).rename('presentations').reset_index()
+
+    return aggregates
+
+def simd_ratio(aggregates):
+    """Ratio of presentations in the most deprived (Q1) to least deprived (Q5) quintile."""
+    simd_totals = aggregates['simd_quintile'].set_index('simd_quintile')['presentations']
+    return simd_totals.loc[1] / simd_totals.loc[5]
+
+if __name__ == "__main__":
+    aggregates = aggregate_presentations()
+
+    print("Presentation totals (out-of-core aggregation)")
+    print("=" * 70)
+    for column, totals in aggregates.items():
+        print(f"\n{column}:")
+        print(totals.to_string(index=False))
+    print(f"\nSIMD Q1/Q5 ratio: {simd_ratio(aggregates):.1f}x")
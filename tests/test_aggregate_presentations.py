@@ -0,0 +1,43 @@
+import pandas as pd
+
+from src.aggregate_presentations import AGGREGATION_COLUMNS, aggregate_presentations, simd_ratio
+
+def _write_sample_csv(path):
+    rows = []
+    for i in range(200):
+        rows.append({
+            'date': f"2019-01-{i % 28 + 1:02d}",
+            'health_board': f"NHS Board {i % 3}",
+            'age_group': ['0-17', '18-25', '26-35'][i % 3],
+            'simd_quintile': i % 5 + 1,
+            'presentation_type': 'Self Harm' if i % 2 else 'Depression',
+            'presentations': i % 7 + 1,
+            'year': 2019 + i // 100,
+            'month': i % 12 + 1,
+            'day_of_week': i % 7,
+            'week_of_year': 1,
+            'is_weekend': int(i % 7 >= 5)
+        })
+    # Category that only appears in the last chunk
+    rows[-1]['health_board'] = 'NHS Orkney'
+    rows[-1]['presentation_type'] = 'Psychosis'
+    pd.DataFrame(rows).to_csv(path, index=False)
+
+def test_matches_in_memory_groupby(tmp_path):
+    path = tmp_path / 'presentations.csv'
+    _write_sample_csv(path)
+
+    # Small ranges force many chunks across the worker pool
+    aggregates = aggregate_presentations(str(path), chunk_bytes=512, max_workers=2)
+    df = pd.read_csv(path)
+
+    for column in AGGREGATION_COLUMNS:
+        expected = df.groupby(column)['presentations'].sum()
+        actual = aggregates[column].set_index(column)['presentations']
+        assert actual.to_dict() == expected.to_dict()
+
+    expected_ratio = (
+        df.loc[df['simd_quintile'] == 1, 'presentations'].sum()
+        / df.loc[df['simd_quintile'] == 5, 'presentations'].sum()
+    )
+    assert simd_ratio(aggregates) == expected_ratio